@@ -1,7 +1,8 @@
-import json
 import logging
 import os
+import time
 
+import orjson
 from dotenv import load_dotenv
 from upstash_redis import Redis
 
@@ -26,32 +27,147 @@ if not CACHE_KV_REST_API_TOKEN:
 # decode_responses=True tells the client to return Python strings (not bytes)
 redis_client = Redis(url=CACHE_KV_REST_API_URL, token=CACHE_KV_REST_API_TOKEN)
 
+# Cache keys. Both caches are stored as hashes (one field per hackathon URL /
+# location), under new keys since the old keys hold string-typed JSON blobs.
+HACKATHONS_KEY = "cache:hackathons:v2"
+LOCATIONS_KEY = "cache:locations:v2"
+# The old keys, migrated into the hashes the first time they are found empty
+LEGACY_HACKATHONS_KEY = "cache:hackathons"
+LEGACY_LOCATIONS_KEY = "cache:locations"
+
+# Expiration times (in seconds) for each cache key.
+# Geocoding results rarely change, so they are kept much longer than hackathons.
+# Each location entry also records when it was geocoded and is ignored once it is
+# older than LOCATIONS_TTL, so every result is eventually re-validated.
+HACKATHONS_TTL = 60 * 60 * 24 * 7
+LOCATIONS_TTL = 60 * 60 * 24 * 30
+
+# Entries as last read from / written to Redis, so that save_cache only
+# has to send the entries that were added or changed.
+_persisted = {"hackathons": {}, "locations": {}}
+
+
+def normalize_location(address: str) -> str:
+    """
+    Returns the key under which a location is cached, so that
+    "Vancouver, BC" and " vancouver, bc" share a single entry.
+    """
+    return address.strip().lower()
+
+
+def _queue_legacy_migration(pipeline, legacy_key: str, blob: str, key: str, ttl: int,
+                            entries: dict, convert) -> dict:
+    """
+    Queues the deletion of a cache's old key, still holding a single JSON blob, and,
+    if the cache's hash is empty, an HSET of the blob's entries converted with
+    `convert` into (field, value) pairs. Returns the hash entries, encoded as HGETALL
+    returns them: the migrated ones if the hash was empty, `entries` otherwise.
+    """
+    pipeline.delete(legacy_key)
+    if entries:
+        return entries
+    try:
+        legacy = orjson.loads(blob)
+    except Exception as e:
+        logger.error("Error decoding legacy cache '%s': %s", legacy_key, e)
+        return {}
+    if not isinstance(legacy, dict):
+        return {}
+
+    migrated = {}
+    for field, value in legacy.items():
+        field, value = convert(field, value)
+        migrated[field] = orjson.dumps(value).decode()
+    if migrated:
+        pipeline.hset(key, values=migrated)
+        pipeline.expire(key, ttl)
+    logger.info("Migrating %s entries from '%s' to '%s'.", len(migrated), legacy_key, key)
+    return migrated
+
+
+def _decode_entries(name: str, entries: dict) -> dict:
+    """
+    Decodes the JSON values of a cached hash, skipping entries that fail to decode.
+    """
+    decoded = {}
+    for field, entry in (entries or {}).items():
+        try:
+            decoded[field] = orjson.loads(entry)
+        except Exception as e:
+            logger.error("Error decoding cached %s entry '%s': %s", name, field, e)
+    return decoded
+
+
+def _decode_locations(entries: dict) -> dict:
+    """
+    Decodes the cached locations, dropping entries geocoded more than LOCATIONS_TTL ago.
+    """
+    expired_before = time.time() - LOCATIONS_TTL
+    locations = {}
+    for location, entry in _decode_entries("locations", entries).items():
+        if isinstance(entry, dict) and entry.get("checked_at", 0) > expired_before:
+            locations[location] = entry["in_bc"]
+    return locations
+
+
+def _queue_changed_entries(pipeline, name: str, key: str, entries: dict, ttl: int, wrap=None) -> dict:
+    """
+    Queues an HSET of the entries that changed since the last load/save, and a
+    refresh of the key's expiration. Returns the changed entries.
+    If given, `wrap` converts each changed value into the form that is stored.
+    """
+    persisted = _persisted[name]
+    changed = {
+        field: value
+        for field, value in entries.items()
+        if persisted.get(field) != value
+    }
+    if changed:
+        pipeline.hset(key, values={
+            field: orjson.dumps(wrap(value) if wrap else value).decode()
+            for field, value in changed.items()
+        })
+        pipeline.expire(key, ttl)
+    return changed
+
 
 def load_cache() -> dict:
     """
     Loads cached data for hackathons and locations from Redis.
     If a key is missing, returns an empty dict for that cache.
     """
-    hackathons = redis_client.get("cache:hackathons")
-    locations = redis_client.get("cache:locations")
+    # All reads are pipelined so they come back in one round-trip. The old keys
+    # are read along with the hashes until they have been migrated and deleted.
+    pipeline = redis_client.pipeline()
+    pipeline.hgetall(HACKATHONS_KEY)
+    pipeline.hgetall(LOCATIONS_KEY)
+    pipeline.get(LEGACY_HACKATHONS_KEY)
+    pipeline.get(LEGACY_LOCATIONS_KEY)
+    hackathon_entries, location_entries, legacy_hackathons, legacy_locations = pipeline.exec()
 
-    if hackathons:
-        try:
-            hackathons = json.loads(hackathons)
-        except Exception as e:
-            logger.error(f"Error decoding hackathons cache: {e}")
-            hackathons = {}
-    else:
-        hackathons = {}
+    # Carry over the caches written before they were stored as hashes, so hackathons
+    # already delivered are not returned again and known locations are not re-geocoded.
+    # Their geocoding time is unknown, so migrated locations count as checked now.
+    if legacy_hackathons or legacy_locations:
+        migration = redis_client.pipeline()
+        if legacy_hackathons:
+            hackathon_entries = _queue_legacy_migration(
+                migration, LEGACY_HACKATHONS_KEY, legacy_hackathons, HACKATHONS_KEY, HACKATHONS_TTL,
+                hackathon_entries, lambda url, hackathon: (url, hackathon),
+            )
+        if legacy_locations:
+            checked_at = int(time.time())
+            location_entries = _queue_legacy_migration(
+                migration, LEGACY_LOCATIONS_KEY, legacy_locations, LOCATIONS_KEY, LOCATIONS_TTL,
+                location_entries,
+                lambda location, in_bc: (normalize_location(location), {"in_bc": bool(in_bc), "checked_at": checked_at}),
+            )
+        migration.exec()
 
-    if locations:
-        try:
-            locations = json.loads(locations)
-        except Exception as e:
-            logger.error(f"Error decoding locations cache: {e}")
-            locations = {}
-    else:
-        locations = {}
+    hackathons = _decode_entries("hackathons", hackathon_entries)
+    locations = _decode_locations(location_entries)
+    _persisted["hackathons"] = dict(hackathons)
+    _persisted["locations"] = dict(locations)
 
     return {"hackathons": hackathons, "locations": locations}
 
@@ -59,10 +175,23 @@ def load_cache() -> dict:
 def save_cache(cache_data: dict):
     """
     Saves the cache data (for hackathons and locations) to Redis.
-    You can also add an expiration time (in seconds) if desired by passing the `ex` parameter.
+    Only entries that changed since the last load/save are written, so
+    concurrent writers add to the cache instead of overwriting each other.
+    Each key expires after HACKATHONS_TTL / LOCATIONS_TTL seconds respectively.
     """
-    hackathons = json.dumps(cache_data.get("hackathons", {}))
-    locations = json.dumps(cache_data.get("locations", {}))
+    # Queue all writes so they are sent as a single pipelined request.
+    pipeline = redis_client.pipeline()
+    changed_hackathons = _queue_changed_entries(
+        pipeline, "hackathons", HACKATHONS_KEY, cache_data.get("hackathons", {}), HACKATHONS_TTL
+    )
+    checked_at = int(time.time())
+    changed_locations = _queue_changed_entries(
+        pipeline, "locations", LOCATIONS_KEY, cache_data.get("locations", {}), LOCATIONS_TTL,
+        wrap=lambda in_bc: {"in_bc": in_bc, "checked_at": checked_at},
+    )
+    if not changed_hackathons and not changed_locations:
+        return
+    pipeline.exec()
 
-    redis_client.set("cache:hackathons", hackathons, ex=604800)
-    redis_client.set("cache:locations", locations, ex=604800)
\ No newline at end of file
+    _persisted["hackathons"].update(changed_hackathons)
+    _persisted["locations"].update(changed_locations)
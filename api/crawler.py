@@ -1,54 +1,262 @@
 import asyncio
+import codecs
 import logging
+import math
 import os
-from typing import List, Dict
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import List, Dict, Optional
 import re
 
 import aiohttp
-import requests
+import orjson
+from yarl import URL
 from dotenv import load_dotenv
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
-from .utils import is_in_british_columbia_google
+from .utils import is_in_british_columbia_google, normalize_location
 from .cache import load_cache, save_cache
 
 load_dotenv()
 GOOGLE_API_MAPS_KEY = os.getenv("GOOGLE_API_MAPS_KEY")
 
-# Configure logger
+# Configure logger. Records propagate to the handler set up by logging.basicConfig
+# in main.py; the level can be raised with CRAWLER_LOG_LEVEL (e.g. INFO) to skip
+# the per-hackathon debug records entirely.
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)  # Set to DEBUG for detailed logs
-handler = logging.StreamHandler()
-formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-handler.setFormatter(formatter)
-logger.addHandler(handler)
+logger.setLevel(os.getenv("CRAWLER_LOG_LEVEL", "DEBUG").upper())
+
+DEVPOST_API_URL = "https://devpost.com/api/hackathons"
+# Fixed part of the listing query, already percent-encoded ("status[]" -> "status%5B%5D"),
+# so each page URL is built by appending the page number instead of encoding params per request
+DEVPOST_QUERY = "order_by=recently-added&status%5B%5D=upcoming&status%5B%5D=open"
 
 SYMBOL_TO_CURRENCY = {
     '$': 'USD',
     'CAD': 'CAD',
 }
 
+# Substrings at least one of which appears in every accepted prize snippet
+CURRENCY_HINTS = tuple(SYMBOL_TO_CURRENCY)
+
+# Prize amounts arrive as tiny HTML snippets such as "<span>$20,000</span>",
+# so stripping tags and matching the amount with regexes is enough.
+# The whole run of non-digit characters before the amount is captured as the
+# currency symbol, so prefixed dollars like "A$" or "CA$" are not taken for "$".
+TAG_RE = re.compile(r'<[^>]+>')
+PRIZE_RE = re.compile(r'([^\d\s,.]+)\s*([\d,]+)')
+
+# Only the eligibility list of a detail page is ever read, so the parser
+# is restricted to that subtree instead of building the whole document
+ELIGIBILITY_STRAINER = SoupStrainer(id='eligibility-list')
+
+# The list's id attribute, matched on the raw bytes while streaming and on the
+# decoded page; bare mentions such as href="#eligibility-list" do not count
+ELIGIBILITY_LIST_ID = r'''(?<![\w-])id\s*=\s*["']?eligibility-list(?![\w-])'''
+ELIGIBILITY_LIST_ID_RE = re.compile(ELIGIBILITY_LIST_ID, re.IGNORECASE)
+ELIGIBILITY_LIST_ID_BYTES_RE = re.compile(ELIGIBILITY_LIST_ID.encode(), re.IGNORECASE)
+# Opening and closing list tags, counted to find where the eligibility list ends
+UL_TAG_RE = re.compile(rb'<(/?)ul\b', re.IGNORECASE)
+
+# Matches "US only" restrictions in eligibility items.
+# Must contain "only", see ELIGIBILITY_HINT_RE.
+US_ONLY_RE = re.compile(r'\bus\s*only\b', re.IGNORECASE)
+
+# Locations that name BC outright are accepted without a geocoding request.
+# Ambiguous city names (Vancouver WA, Victoria AU, Richmond VA, ...) still go to Google.
+BC_LOCATION_RE = re.compile(r'\bbritish columbia\b|,\s*b\.?c\.?\b|\bburnaby\b', re.IGNORECASE)
+
+# Eligibility phrases that indicate non-target audiences (lowercase),
+# compiled into one alternation so each item is scanned once.
+# Every phrase must contain "only", see ELIGIBILITY_HINT_RE.
+EXCLUDED_KEYWORDS = ('ages 13 to 18 only',)
+EXCLUDED_KEYWORDS_RE = re.compile('|'.join(map(re.escape, EXCLUDED_KEYWORDS)))
+
+# Every excluding phrase ("US only", "ages 13 to 18 only") contains this word,
+# so eligibility lists without it can skip HTML parsing altogether
+ELIGIBILITY_HINT_RE = re.compile(r'only', re.IGNORECASE)
+
+# Upper bound on simultaneous Devpost page and detail-page requests
+MAX_CONCURRENT_REQUESTS = 20
+# Devpost listing pages are requested more politely
+MAX_CONCURRENT_PAGE_REQUESTS = 10
+
+# Detail pages are streamed and read only up to the end of the eligibility list,
+# with a hard cap for pages that do not have one
+DETAIL_CHUNK_SIZE = 8192
+MAX_DETAIL_BYTES = 2 * 1024 * 1024
+
+# Parsed detail pages (including empty results for dead links) kept per process,
+# so URLs seen in earlier runs are not fetched again
+DETAIL_CACHE_SIZE = 2048
+_detail_cache: "OrderedDict[str, Dict]" = OrderedDict()
+
+# Shared HTTP session, opened by the app's lifespan so connections are reused
+# across requests, together with the event loop it is bound to
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _new_session() -> aiohttp.ClientSession:
+    """
+    Creates an aiohttp session with the crawler's connection pool and timeout settings.
+    """
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=MAX_CONCURRENT_REQUESTS,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+        ),
+        timeout=aiohttp.ClientTimeout(total=15),
+    )
 
-async def fetch_hackathon_detail(session: aiohttp.ClientSession, url: str) -> str:
+
+async def open_session():
     """
-    Asynchronously fetches the HTML content of a hackathon's detail page.
+    Opens the shared aiohttp session on the running event loop.
+    """
+    global _session, _session_loop
+    await close_session()
+    _session = _new_session()
+    _session_loop = asyncio.get_running_loop()
+
+
+async def close_session():
+    """
+    Closes the shared aiohttp session, if one was opened.
+    """
+    global _session, _session_loop
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+    _session_loop = None
+
+
+@asynccontextmanager
+async def crawl_session():
+    """
+    Yields the shared session if it was opened on the running event loop.
+    Otherwise (no lifespan, or a runtime that starts a new loop per invocation)
+    yields a session scoped to this crawl, closed when the crawl ends.
+    """
+    if _session is not None and not _session.closed and _session_loop is asyncio.get_running_loop():
+        yield _session
+    else:
+        async with _new_session() as session:
+            yield session
+
+
+async def fetch_hackathon_page(session: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+                               api_base_url: str, page: int) -> Dict:
+    """
+    Asynchronously fetches one page of hackathons from Devpost's API.
+    Returns the decoded page ("hackathons" and "meta"), or an empty dict if the
+    request or JSON parsing fails.
     """
+    url = URL(f"{api_base_url}?{DEVPOST_QUERY}&page={page}", encoded=True)
+    async with semaphore:
+        try:
+            logger.debug("Making GET request to %s", url)
+            async with session.get(url) as response:
+                response.raise_for_status()
+                body = await response.read()
+            logger.debug("API request successful for page %s.", page)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error("Error fetching data from API on page %s: %s", page, e, exc_info=True)
+            return {}
+
     try:
-        async with session.get(url) as response:
-            response.raise_for_status()
-            html_content = await response.text()
-            logger.debug(f"Fetched detail page for URL: {url}")
-            return html_content
-    except aiohttp.ClientError as e:
-        logger.error(f"Error fetching detail page for {url}: {e}", exc_info=True)
-        return ""
+        data = orjson.loads(body)
+        logger.debug("Received %s hackathons from API on page %s.", len(data.get('hackathons', [])), page)
+        return data
+    except ValueError as e:
+        logger.error("Error parsing JSON response on page %s: %s", page, e, exc_info=True)
+        return {}
+
+
+def count_pages(page_data: Dict) -> int:
+    """
+    Returns the total number of pages reported in a Devpost page's metadata,
+    or 1 if the metadata is missing.
+    """
+    meta = page_data.get("meta") or {}
+    total_count = meta.get("total_count")
+    per_page = meta.get("per_page")
+    if not total_count or not per_page:
+        return 1
+    return math.ceil(total_count / per_page)
+
+
+async def read_until_eligibility_list(response: aiohttp.ClientResponse) -> str:
+    """
+    Reads a detail page body up to the closing tag of the eligibility list
+    (or MAX_DETAIL_BYTES), so the rest of the page is neither downloaded nor decoded.
+    """
+    buffer = bytearray()
+    list_start = -1
+    depth = 1  # The list's own <ul> is open once its id has been seen
+    tag_scan = 0
+    async for chunk in response.content.iter_chunked(DETAIL_CHUNK_SIZE):
+        # Markers may straddle chunk boundaries, so rescan a few bytes of the previous chunk
+        scan_from = max(len(buffer) - 64, 0)
+        buffer.extend(chunk)
+        if list_start == -1:
+            match = ELIGIBILITY_LIST_ID_BYTES_RE.search(buffer, scan_from)
+            if match:
+                list_start = tag_scan = match.end()
+        if list_start != -1:
+            # Nested lists are counted, so the read stops at the </ul> that closes this one
+            for tag in UL_TAG_RE.finditer(buffer, tag_scan):
+                depth += -1 if tag.group(1) else 1
+                tag_scan = tag.end()
+                if depth == 0:
+                    break
+            if depth == 0:
+                break
+            # A tag cut off at the end of the buffer is rescanned with the next chunk
+            tag_scan = max(tag_scan, len(buffer) - 4)
+        if len(buffer) >= MAX_DETAIL_BYTES:
+            logger.warning("Detail page for URL %s exceeds %s bytes. Truncating.", response.url, MAX_DETAIL_BYTES)
+            break
+
+    # Like response.text(), fall back to UTF-8 when the declared charset is unknown
+    encoding = response.charset or 'utf-8'
+    try:
+        codecs.lookup(encoding)
+    except LookupError:
+        logger.warning("Unknown charset '%s' for URL %s. Decoding as UTF-8.", encoding, response.url)
+        encoding = 'utf-8'
+    return buffer.decode(encoding, errors='replace')
+
+
+async def fetch_hackathon_detail(session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, url: str) -> str:
+    """
+    Asynchronously fetches the HTML content of a hackathon's detail page.
+    """
+    async with semaphore:
+        try:
+            async with session.get(url) as response:
+                response.raise_for_status()
+                html_content = await read_until_eligibility_list(response)
+                logger.debug("Fetched detail page for URL: %s", url)
+                return html_content
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error("Error fetching detail page for %s: %s", url, e, exc_info=True)
+            return ""
 
 def parse_hackathon_details(html_content: str) -> Dict:
     """
     Parses the hackathon detail page to extract additional information
     such as "US only" restriction.
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
+    # Only the eligibility list itself is searched: the page head alone contains
+    # "only" in ordinary markup such as CSS "@media only screen"
+    list_match = ELIGIBILITY_LIST_ID_RE.search(html_content)
+    if list_match is None or not ELIGIBILITY_HINT_RE.search(html_content, list_match.end()):
+        logger.debug("No restrictive eligibility wording found. Skipping detail parsing.")
+        return {"eligibility_items": [], "US only": False}
+
+    soup = BeautifulSoup(html_content, 'lxml', parse_only=ELIGIBILITY_STRAINER)
     details = {}
 
     eligibility_elements = soup.select('#eligibility-list li')
@@ -61,38 +269,60 @@ def parse_hackathon_details(html_content: str) -> Dict:
             for item in eligibility_elements
         ]
         details["eligibility_items"] = eligibility_items_text
-        logger.debug(f"Parsed eligibility items: {eligibility_items_text}")
+        logger.debug("Parsed eligibility items: %s", eligibility_items_text)
 
         # Use regex for flexible matching
-        us_only_pattern = re.compile(r'\bus\s*only\b', re.IGNORECASE)
-        details["US only"] = any(us_only_pattern.search(entry) for entry in eligibility_items_text)
-        logger.debug(f"US only flag set to: {details['US only']}")
+        details["US only"] = any(US_ONLY_RE.search(entry) for entry in eligibility_items_text)
+        logger.debug("US only flag set to: %s", details['US only'])
 
     return details
 
 
-async def fetch_all_hackathon_details(hackathons: List[Dict]) -> Dict[str, Dict]:
+async def fetch_and_parse_hackathon_detail(session: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+                                           url: str) -> Dict:
     """
-    Asynchronously fetches and parses detailed information for all hackathons.
-    Returns a mapping from hackathon URL to its detailed info.
+    Asynchronously fetches and parses the detail page of a single hackathon.
+    Returns an empty dict if the page could not be fetched.
+    Results are kept in a bounded LRU cache keyed by URL.
     """
-    detailed_info = {}
-    async with aiohttp.ClientSession() as session:
-        tasks = []
-        for hackathon in hackathons:
-            url = hackathon['url']
-            tasks.append(fetch_hackathon_detail(session, url))
+    if url in _detail_cache:
+        _detail_cache.move_to_end(url)
+        logger.debug("Detail page for URL found in memory cache: %s", url)
+        return _detail_cache[url]
 
-        html_contents = await asyncio.gather(*tasks)
+    html = await fetch_hackathon_detail(session, semaphore, url)
+    details = parse_hackathon_details(html) if html else {}
+
+    _detail_cache[url] = details
+    if len(_detail_cache) > DETAIL_CACHE_SIZE:
+        _detail_cache.popitem(last=False)
+    return details
 
-        for hackathon, html in zip(hackathons, html_contents):
-            if html:
-                details = parse_hackathon_details(html)
-                detailed_info[hackathon['url']] = details
-            else:
-                detailed_info[hackathon['url']] = {}
 
-    return detailed_info
+def is_online(hackathon: Dict) -> bool:
+    """
+    Returns True if the hackathon's location marks it as an online event.
+    """
+    return "online" in hackathon["location"].lower()
+
+
+def is_evidently_in_bc(hackathon: Dict) -> bool:
+    """
+    Returns True if the hackathon's location names British Columbia unambiguously.
+    """
+    return BC_LOCATION_RE.search(hackathon["location"]) is not None
+
+
+async def fetch_details_if_in_bc(session: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+                                 hackathon: Dict, location_check: "asyncio.Task[bool]") -> Optional[Dict]:
+    """
+    Waits for the geocoding check of an in-person hackathon's location and, if it
+    is in BC, Canada, fetches its detail page. Returns None if it is not in BC.
+    """
+    if not await location_check:
+        logger.debug("Hackathon '%s' is not in British Columbia. Skipping.", hackathon['name'])
+        return None
+    return await fetch_and_parse_hackathon_detail(session, semaphore, hackathon["url"])
 
 
 def is_target_audience(eligibility_items: List[str]) -> bool:
@@ -100,17 +330,77 @@ def is_target_audience(eligibility_items: List[str]) -> bool:
     Determines if the hackathon is suitable for the target audience based on eligibility criteria.
     Returns True if suitable, False otherwise.
     """
-    # Define keywords that indicate non-target audiences
-    excluded_keywords = ['ages 13 to 18 only']  # Changed to lowercase
-
-    for keyword in excluded_keywords:
-        if any(keyword in item for item in eligibility_items):
-            logger.debug(f"Eligibility contains excluded keyword: '{keyword}'")
+    for item in eligibility_items:
+        match = EXCLUDED_KEYWORDS_RE.search(item)
+        if match:
+            logger.debug("Eligibility contains excluded keyword: '%s'", match.group(0))
             return False
     return True
 
 
-def fetch_hackathon_data(api_base_url: str, num_pages: int = 2) -> List[Dict]:
+def apply_initial_filters(hackathon: Dict, hackathon_cache: Dict) -> Optional[Dict]:
+    """
+    Applies the cache and prize/currency filters to a raw Devpost hackathon.
+    Returns the hackathon in response format if it passes, None otherwise.
+    The location is checked separately since it may need a geocoding request.
+    """
+    title = hackathon.get("title", "N/A")
+    url = hackathon.get("url", "N/A")
+
+    # **Skip hackathons already in cache**
+    if url in hackathon_cache:
+        logger.debug("Skipping hackathon '%s' as it is already in cache.", title)
+        return None
+
+    displayed_location = hackathon.get("displayed_location", {})
+    location = displayed_location.get("location", "Unknown")
+
+    prize_html = hackathon.get("prize_amount", "")
+    submission_period_dates = hackathon.get("submission_period_dates", "Unknown")
+
+    # Cheap substring check before any parsing: most rows use currencies that are never accepted
+    if not any(hint in prize_html for hint in CURRENCY_HINTS):
+        logger.debug("Skipping hackathon '%s' as its prize is not in an accepted currency.", title)
+        return None
+
+    # Parse prize_amount to extract currency symbol and amount
+    prize_match = PRIZE_RE.search(TAG_RE.sub('', prize_html))  # E.g., "₹180,000" or "$20,000"
+
+    if not prize_match:
+        logger.debug("Hackathon '%s' has no prize amount. Skipping.", title)
+        return None
+
+    # Extract currency symbol and numeric value
+    currency_symbol = prize_match.group(1)
+    try:
+        prize_amount = int(prize_match.group(2).replace(',', ''))
+    except ValueError:
+        logger.debug("Hackathon '%s' has an unparseable prize amount. Skipping.", title)
+        return None
+
+    # **Skip hackathons without prize money**
+    if prize_amount <= 0:
+        logger.debug("Skipping hackathon '%s' as its prize amount is zero.", title)
+        return None
+
+    # **Skip hackathons with excluded currencies** (anything not mapped to a currency code)
+    currency_code = SYMBOL_TO_CURRENCY.get(currency_symbol)
+    if currency_code is None:
+        logger.debug("Skipping hackathon '%s' due to excluded currency symbol: %s", title, currency_symbol)
+        return None
+
+    logger.debug("Hackathon '%s' passed initial filters.", title)
+    return {
+        "name": title,
+        "url": url,
+        "location": location,
+        "prize": f"{currency_code} {prize_amount:,}",
+        "date": submission_period_dates
+    }
+
+
+async def fetch_hackathon_data(api_base_url: str = DEVPOST_API_URL,
+                               num_pages: Optional[int] = 2) -> List[Dict]:
     """
     Fetches hackathon data from Devpost's API endpoint, returning only hackathons
     that match certain filters across multiple pages:
@@ -120,152 +410,140 @@ def fetch_hackathon_data(api_base_url: str, num_pages: int = 2) -> List[Dict]:
       - Prize amount greater than zero
       - Suitable for target audience (e.g., not exclusively for high schoolers)
 
+    All pages are requested concurrently; each page is filtered as soon as it
+    arrives, and the geocoding check and detail fetch for the hackathons that
+    pass start immediately, without waiting for the remaining pages.
+
     Args:
         api_base_url (str): The base URL for the Devpost hackathons API.
-        num_pages (int): Number of pages to fetch. Default is 2.
+            Defaults to DEVPOST_API_URL.
+        num_pages (Optional[int]): Number of pages to fetch. Default is 2.
+            If None, every page is fetched: page 1 is requested first and the
+            total page count is read from its metadata.
 
     Returns:
         List[Dict]: A list of filtered hackathons.
     """
-    all_hackathons = []
+    async with crawl_session() as session:
+        return await _crawl(session, api_base_url, num_pages)
 
-    for page in range(1, num_pages + 1):
-        params = {
-            "order_by": "recently-added",
-            "status[]": ["upcoming", "open"],
-            "page": page,
-        }
-        try:
-            logger.debug(f"Making GET request to {api_base_url} with params {params}")
-            response = requests.get(api_base_url, params=params)
-            response.raise_for_status()
-            logger.debug(f"API request successful for page {page}.")
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error fetching data from API on page {page}: {e}", exc_info=True)
-            continue  # Proceed to the next page
 
-        try:
-            data = response.json()
-            hackathon_list = data.get("hackathons", [])
-            logger.debug(f"Received {len(hackathon_list)} hackathons from API on page {page}.")
-            all_hackathons.extend(hackathon_list)
-        except ValueError as e:
-            logger.error(f"Error parsing JSON response on page {page}: {e}", exc_info=True)
-            continue  # Proceed to the next page
-
-    if not all_hackathons:
-        logger.warning("No hackathons found across the specified pages.")
-        return []
+async def _crawl(session: aiohttp.ClientSession, api_base_url: str, num_pages: Optional[int]) -> List[Dict]:
+    """
+    Runs the crawl described in fetch_hackathon_data over the given session.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
 
     # === Load cache (for hackathons & locations) ===
-    cache_data = load_cache()
-    hackathon_cache = cache_data.get("hackathons", {})  # Safely get "hackathons" key
+    # The Redis client is blocking, so it runs in a worker thread, overlapping the page requests
+    cache_load = asyncio.create_task(asyncio.to_thread(load_cache))
 
+    received_count = 0
+    seen_urls = set()
     filtered_hackathons = []
+    detail_tasks: Dict[str, asyncio.Task] = {}
+    # One geocoding check per distinct location, shared by every hackathon held there
+    location_checks: Dict[str, asyncio.Task] = {}
+
+    page_semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGE_REQUESTS)
+    first_requests = []
+    first_page = 1
+    if num_pages is None:
+        first_request = asyncio.create_task(fetch_hackathon_page(session, page_semaphore, api_base_url, 1))
+        num_pages = count_pages(await first_request)
+        logger.debug("Devpost reports %s pages of hackathons.", num_pages)
+        first_requests.append(first_request)
+        first_page = 2
+
+    page_requests = [*first_requests, *asyncio.as_completed([
+        asyncio.create_task(fetch_hackathon_page(session, page_semaphore, api_base_url, page))
+        for page in range(first_page, num_pages + 1)
+    ])]
+
+    cache_data = await cache_load
+    hackathon_cache = cache_data.get("hackathons", {})  # Safely get "hackathons" key
+    location_cache = cache_data.setdefault("locations", {})  # Geocoding results, persisted with the cache
+
+    for page_request in page_requests:
+        hackathon_list = (await page_request).get("hackathons", [])
+        received_count += len(hackathon_list)
+
+        for hackathon in hackathon_list:
+            # Listings can shift between pages, so the same hackathon may show up twice
+            url = hackathon.get("url", "N/A")
+            if url in seen_urls:
+                continue
+            seen_urls.add(url)
+
+            hackathon_dict = apply_initial_filters(hackathon, hackathon_cache)
+            if hackathon_dict is None:
+                continue
+
+            # Start the location check and detail fetch right away; remaining pages keep streaming in.
+            # Local checks come first, so Google is only asked about locations they cannot settle.
+            if is_online(hackathon_dict):
+                logger.debug("Hackathon '%s' is online.", hackathon_dict['name'])
+                detail_request = fetch_and_parse_hackathon_detail(session, semaphore, url)
+            elif is_evidently_in_bc(hackathon_dict):
+                logger.debug("Hackathon '%s' is in British Columbia (from its location).", hackathon_dict['name'])
+                detail_request = fetch_and_parse_hackathon_detail(session, semaphore, url)
+            else:
+                location = hackathon_dict["location"]
+                location_key = normalize_location(location)
+                if location_key not in location_checks:
+                    location_checks[location_key] = asyncio.create_task(
+                        is_in_british_columbia_google(location, GOOGLE_API_MAPS_KEY, session, semaphore, location_cache)
+                    )
+                detail_request = fetch_details_if_in_bc(session, semaphore, hackathon_dict,
+                                                        location_checks[location_key])
+            detail_tasks[url] = asyncio.create_task(detail_request)
+            filtered_hackathons.append(hackathon_dict)
+
+    if not received_count:
+        logger.warning("No hackathons found across the specified pages.")
+        return []
 
-    for hackathon in all_hackathons:
-        title = hackathon.get("title", "N/A")
-        url = hackathon.get("url", "N/A")
-
-        # **Skip hackathons already in cache**
-        if url in hackathon_cache:
-            logger.debug(f"Skipping hackathon '{title}' as it is already in cache.")
-            continue  # Skip to the next hackathon
-
-        displayed_location = hackathon.get("displayed_location", {})
-        location = displayed_location.get("location", "Unknown")
-
-        prize_html = hackathon.get("prize_amount", "")
-        submission_period_dates = hackathon.get("submission_period_dates", "Unknown")
-
-        # Parse prize_amount to extract currency symbol and amount
-        soup = BeautifulSoup(prize_html, 'html.parser')
-        prize_text = soup.get_text(strip=True)  # E.g., "₹180,000" or "$20,000"
-
-        if not prize_text:
-            logger.debug(f"Hackathon '{title}' has no prize amount. Skipping.")
-            continue
-
-        # Extract currency symbol and numeric value
-        # Assuming the first character is the currency symbol
-        currency_symbol = prize_text[0]
-        prize_amount_str = prize_text[1:].replace(',', '')  # Remove commas
-        prize_amount = int(prize_amount_str) if prize_amount_str.isdigit() else 0
-
-        # **Skip hackathons with excluded currencies**
-        if currency_symbol not in SYMBOL_TO_CURRENCY:
-            logger.debug(f"Skipping hackathon '{title}' due to excluded currency symbol: {currency_symbol}")
-            continue
-
-        # Determine the currency code
-        currency_code = SYMBOL_TO_CURRENCY.get(currency_symbol, None)
-        if not currency_code:
-            logger.debug(f"Currency symbol '{currency_symbol}' not mapped to any currency code.")
-            continue
-
-        # Location check:
-        loc_lower = location.lower()
-        if "online" in loc_lower:
-            logger.debug(f"Hackathon '{title}' is online.")
-        else:
-            # Confirm geocoding => BC, Canada
-            if not is_in_british_columbia_google(location, GOOGLE_API_MAPS_KEY):
-                logger.debug(f"Hackathon '{title}' is not in British Columbia. Skipping.")
-                continue  # Skip if not in BC
-
-        # If it passes the initial filters, prepare to check detailed eligibility
-        hackathon_dict = {
-            "name": title,
-            "url": url,
-            "location": location,
-            "prize": f"{currency_code} {prize_amount:,}",
-            "date": submission_period_dates
-        }
-
-        # Append to the list for detailed checks
-        filtered_hackathons.append(hackathon_dict)
-        logger.debug(f"Hackathon '{title}' passed initial filters.")
-
-    # === Fetch and parse detailed information asynchronously ===
+    # === Collect detailed information fetched asynchronously ===
     if filtered_hackathons:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        detailed_info = loop.run_until_complete(fetch_all_hackathon_details(filtered_hackathons))
-        loop.close()
+        detailed_info = dict(zip(detail_tasks.keys(), await asyncio.gather(*detail_tasks.values())))
 
-        logger.debug(f"Fetched detailed information for {len(detailed_info)} hackathons.")
+        logger.debug("Fetched detailed information for %s hackathons.", len(detailed_info))
 
         # **Filter based on detailed eligibility**
         final_filtered_hackathons = []
         for hackathon in filtered_hackathons:
             url = hackathon['url']
             details = detailed_info.get(url, {})
-            logger.debug(f"details: {details}")
+            if details is None:
+                continue  # Rejected by the location check
+            logger.debug("details: %s", details)
 
-            logger.debug(f"Applying eligibility filters for hackathon: {hackathon['name']}")
+            logger.debug("Applying eligibility filters for hackathon: %s", hackathon['name'])
             # 1) Skip if "US only" is detected
             if details.get("US only", False):
-                logger.debug(f"Hackathon '{hackathon['name']}' is US-only. Excluding.")
+                logger.debug("Hackathon '%s' is US-only. Excluding.", hackathon['name'])
                 continue
 
             # 2) If you also want to skip if it’s only for high/middle schoolers,
             eligibility_items = details.get('eligibility_items', [])
             if not is_target_audience(eligibility_items):
-                logger.debug(f"Hackathon '{hackathon['name']}' excluded based on eligibility (e.g. high school).")
+                logger.debug("Hackathon '%s' excluded based on eligibility (e.g. high school).", hackathon['name'])
                 continue
 
             # If everything is fine, add to final list:
             hackathon_cache[url] = hackathon
             final_filtered_hackathons.append(hackathon)
-            logger.debug(f"Hackathon '{hackathon['name']}' added to final filtered list.")
+            logger.debug("Hackathon '%s' added to final filtered list.", hackathon['name'])
 
-        logger.debug(f"Final filtered hackathons count: {len(final_filtered_hackathons)}")
+        logger.debug("Final filtered hackathons count: %s", len(final_filtered_hackathons))
         # **Persist the updated cache**
         cache_data["hackathons"] = hackathon_cache
-        save_cache(cache_data)
-        logger.info(f"Total new filtered hackathons: {len(final_filtered_hackathons)}")
+        await asyncio.to_thread(save_cache, cache_data)
+        logger.info("Total new filtered hackathons: %s", len(final_filtered_hackathons))
         return final_filtered_hackathons
 
     else:
         logger.info("No new hackathons passed the initial filters.")
+        # Still persist any locations geocoded during this run
+        await asyncio.to_thread(save_cache, cache_data)
         return []
\ No newline at end of file
@@ -1,3 +1,5 @@
+from contextlib import asynccontextmanager
+
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException, Request, Header
 import logging
@@ -19,7 +21,16 @@ logger = logging.getLogger(__name__)
 
 API_KEY = os.getenv("API_KEY")
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Pool the crawler's HTTP connections across requests served on this loop
+    await crawler.open_session()
+    yield
+    # Release the crawler's pooled HTTP connections on shutdown
+    await crawler.close_session()
+
+app = FastAPI(lifespan=lifespan)
 
 @app.get("/")
 async def root():
@@ -27,27 +38,25 @@ async def root():
     return {"message": "Welcome to Vercel!"}
 
 @app.get("/hackathons", response_model=schemas.HackathonResponse)
-def get_hackathons(x_api_key: str = Header(None)):
+async def get_hackathons(x_api_key: str = Header(None)):
     if x_api_key != API_KEY:
         logger.warning("Unauthorized access attempt detected.")
         raise HTTPException(status_code=401, detail="Unauthorized")
 
-    DEVPOST_API_BASE = "https://devpost.com/api/hackathons"
-
-    logger.info(f"Fetching hackathons from Devpost API.")
+    logger.info("Fetching hackathons from Devpost API.")
 
-    hackathons = crawler.fetch_hackathon_data(DEVPOST_API_BASE, num_pages=2)
+    hackathons = await crawler.fetch_hackathon_data(num_pages=2)
 
     if not hackathons:
         logger.warning("No hackathons found or unable to fetch data.")
 
-    logger.info(f"Fetched {len(hackathons)} hackathons successfully.")
+    logger.info("Fetched %s hackathons successfully.", len(hackathons))
     return {"hackathons": hackathons}
 
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
     return JSONResponse(
         status_code=500,
         content={"message": "Internal Server Error"},
@@ -1,66 +1,125 @@
+import asyncio
 import logging
-import requests
-from .cache import load_cache, save_cache
+from typing import Dict, List, Optional
+
+import aiohttp
+import orjson
+from .cache import normalize_location
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
-def is_in_british_columbia_google(address: str, api_key: str) -> bool:
+GEOCODING_API_URL = "https://maps.googleapis.com/maps/api/geocode/json"
+GEOCODING_TIMEOUT = aiohttp.ClientTimeout(total=5)
+
+# Transient failures (rate limiting, 5xx, dropped connections, timeouts) are
+# retried with exponential backoff: 0.3s, 0.6s, 1.2s
+GEOCODING_RETRIES = 3
+GEOCODING_BACKOFF = 0.3
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+async def request_geocode(session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, params: dict) -> dict:
+    """
+    Calls the Google Geocoding API and returns the decoded JSON response,
+    retrying transient failures up to GEOCODING_RETRIES times.
+    """
+    for attempt in range(GEOCODING_RETRIES + 1):
+        last_attempt = attempt == GEOCODING_RETRIES
+        try:
+            async with semaphore:
+                async with session.get(GEOCODING_API_URL, params=params, timeout=GEOCODING_TIMEOUT) as response:
+                    if response.status not in RETRY_STATUSES or last_attempt:
+                        response.raise_for_status()
+                        return orjson.loads(await response.read())
+                    logger.warning("Google Geocoding API returned status %s. Retrying.", response.status)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            if last_attempt:
+                raise
+            logger.warning("Error calling Google Geocoding API: %r. Retrying.", e)
+        await asyncio.sleep(GEOCODING_BACKOFF * 2 ** attempt)
 
-    # 1. Load current cache
-    cache_data = load_cache()
-    location_cache = cache_data["locations"]  # e.g., {"Vancouver, BC": True, "Berlin, Germany": False}
 
-    # 2. Check if we already have a cached result
-    if address in location_cache:
-        logger.debug(f"Location '{address}' found in cache: {location_cache[address]}")
-        return location_cache[address]
+def _components_in_bc(components: List[Dict]) -> bool:
+    """
+    Checks a geocoding result's address components for province British Columbia
+    and country CA. Stops at the first mismatch or as soon as both are found; a
+    result that names neither does not count as BC.
+    """
+    is_bc = is_ca = False
+    for component in components:
+        types = set(component["types"])
+        if "administrative_area_level_1" in types:
+            is_bc = component["long_name"].lower() == "british columbia"
+            if not is_bc:
+                return False
+        if "country" in types:
+            is_ca = component["short_name"].lower() == "ca"
+            if not is_ca:
+                return False
+        if is_bc and is_ca:
+            return True
+    return False
 
-    # 3. If not cached, we call the Google Geocoding API
-    url = "https://maps.googleapis.com/maps/api/geocode/json"
-    params = {"address": address, "key": api_key}
+
+async def _geocode_is_bc_uncached(address: str, api_key: str, session: aiohttp.ClientSession,
+                                  semaphore: asyncio.Semaphore) -> Optional[bool]:
+    """
+    Asks the Google Geocoding API whether an address is in British Columbia, Canada.
+    Returns None if the API call failed, so that the failure is not cached.
+    """
+    params = {"address": address}
+    if api_key:
+        params["key"] = api_key
 
     try:
-        logger.debug(f"Making GET request to Google Geocoding API for address: {address}")
-        r = requests.get(url, params=params)
-        r.raise_for_status()
-        data = r.json()
+        logger.debug("Making GET request to Google Geocoding API for address: %s", address)
+        data = await request_geocode(session, semaphore, params)
         logger.debug("Google Geocoding API request successful.")
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Error calling Google Geocoding API: {e}", exc_info=True)
-        return False
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        logger.error("Error calling Google Geocoding API: %s", e, exc_info=True)
+        return None
     except ValueError as e:
-        logger.error(f"Error parsing Google Geocoding API response: {e}", exc_info=True)
-        return False
+        logger.error("Error parsing Google Geocoding API response: %s", e, exc_info=True)
+        return None
 
-    # If no results, we consider it not in BC
+    # If no results, we consider it not in BC. Only a ZERO_RESULTS answer counts:
+    # other statuses (quota exceeded, request denied, ...) are failures, not answers.
     if not data.get("results"):
-        logger.warning(f"No results found for address: {address}")
-        location_cache[address] = False
-        save_cache(cache_data)
-        return False
+        status = data.get("status")
+        if status == "ZERO_RESULTS":
+            logger.warning("No results found for address: %s", address)
+            return False
+        logger.error("Google Geocoding API returned status %s for address: %s", status, address)
+        return None
 
     # The first result
     result = data["results"][0]
 
-    # parse address_components
-    is_bc = True  # We'll assume True until proven otherwise
-    for component in result["address_components"]:
-        if "administrative_area_level_1" in component["types"]:
-            province = component["long_name"].lower()
-            if province != "british columbia":
-                is_bc = False
-                break
-        if "country" in component["types"]:
-            country = component["short_name"].lower()
-            if country != "ca":
-                is_bc = False
-                break
-
-    logger.debug(f"Address '{address}' is in British Columbia: {is_bc}")
-
-    # 4. Save the result to the cache
-    location_cache[address] = is_bc
-    save_cache(cache_data)
-
-    return is_bc
\ No newline at end of file
+    is_bc = _components_in_bc(result.get("address_components", []))
+    logger.debug("Address '%s' is in British Columbia: %s", address, is_bc)
+    return is_bc
+
+
+async def is_in_british_columbia_google(address: str, api_key: str, session: aiohttp.ClientSession,
+                                       semaphore: asyncio.Semaphore,
+                                       location_cache: Dict[str, bool]) -> bool:
+    """
+    Checks whether an address is in British Columbia, Canada using the Google Geocoding API.
+    Requests go through the given session, at most as many at once as `semaphore` allows.
+    Results are read from and written to `location_cache` (e.g. {"vancouver, bc": True});
+    persisting it is left to the caller, so no Redis I/O happens here.
+    """
+    cache_key = normalize_location(address)
+
+    # 1. Check if we already have a cached result
+    if cache_key in location_cache:
+        logger.debug("Location '%s' found in cache: %s", address, location_cache[cache_key])
+        return location_cache[cache_key]
+
+    # 2. Fall back to the Google Geocoding API and record the result
+    is_bc = await _geocode_is_bc_uncached(address, api_key, session, semaphore)
+    if is_bc is None:
+        return False
+    location_cache[cache_key] = is_bc
+    return is_bc